@@ -13,45 +13,79 @@ import csv
 import datetime
 import math
 import sys
+import numpy as np
 from codrone_edu.drone import *
 
 
+# Cache for the second-resolution prefix of log timestamps.  The strftime()
+# call only runs when the whole-second value changes; within the same second
+# only the microseconds field is re-formatted.
+_cached_sec = -1
+_cached_prefix = ''
+
+# Reciprocal of the 0.05 s segment time used by send_abs_pos_w_output,
+# so segment counts need one multiply instead of two divisions.
+_INV_DT = 20.0
+
+
+def _fmt_now():
+    #
+    # Return the current date and time as an 'mm/dd/yyyy hh:mm:ss.uuuuuu'
+    # string, reusing the cached prefix while the current second is unchanged.
+    #
+    global _cached_sec, _cached_prefix
+    now = datetime.datetime.now()
+    sec_key = int(now.timestamp())
+    if sec_key != _cached_sec:
+        _cached_prefix = now.strftime('%m/%d/%Y %H:%M:%S')
+        _cached_sec = sec_key
+    return f'{_cached_prefix}.{now.microsecond:06d}'
+
+
 def main():
     # Check whether '-f' was included as a command-line option
     # If so, open output datafile.
     if '-f' in sys.argv:
         write_datafile = True
         filename = 'drone_path'
-        now = datetime.datetime.now()
-        date_time_str = f"{now.month:02d}{now.day:02d}{now.year}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
-        file_out = open(filename + date_time_str + '.csv', 'w', newline='')
+        date_time_str = datetime.datetime.now().strftime('%m%d%Y_%H%M%S')
+        file_out = open(filename + date_time_str + '.csv', 'w', newline='', buffering=1 << 16)
+        # The csv module is only needed for the header; data rows are
+        # formatted and written directly by DroneCalibrated.
         writer = csv.writer(file_out)
         writer.writerow(['CoDrone Location vs Time', date_time_str])
     else:
         write_datafile = False
         file_out = None
-        writer = None
 
     # Create drone object and DroneCalibrated object
     drone = Drone()
-    drone_cal = DroneCalibrated(drone, write_datafile, writer)
+    drone_cal = DroneCalibrated(drone, write_datafile, file_out)
+
+    # Map each menu option to a bound method once, then dispatch with a
+    # single dict lookup per selection.  This also shows the menu exactly
+    # once per action; previously option_select() ran twice before the
+    # first command was dispatched.
+    dispatch = {
+        1: drone_cal.drone_pair,
+        2: lambda: drone_cal.drone_takeoff(0.15),
+        3: lambda: drone_cal.move_cal(20, 2),
+        4: lambda: drone_cal.mov_xyz_abs(0.5, 0.5),
+        5: lambda: drone_cal.move_xyz_simple(0.5, 0.5),
+        6: drone_cal.drone_land,
+    }
 
     # Display menu and get user input
-    selected = option_select()
-    while selected != 7:
+    while True:
         selected = option_select()
-        match selected:
-            case 1: drone_cal.drone_pair()
-            case 2: drone_cal.drone_takeoff(0.15)
-            case 3: drone_cal.move_cal(20, 2)
-            case 4: drone_cal.mov_xyz_abs(0.5, 0.5)
-            case 5: drone_cal.move_xyz_simple(0.5, 0.5)
-            case 6: drone_cal.drone_land()
-            case _: break
-
-    # If command-line option '-f' was present, close
-    # open output datafile.
+        if selected == 7:
+            break
+        dispatch[selected]()
+
+    # If command-line option '-f' was present, flush any buffered
+    # log rows and close the open output datafile.
     if write_datafile:
+        drone_cal._flush()
         file_out.close()
 
 
@@ -72,23 +106,23 @@ def display_menu():
 
 
 def option_select():
-    selected = int(0)
-    while selected < 1:
+    #
+    # Prompt until the user enters a single character '1' - '7', and map
+    # the character directly to its integer value.  A one-character range
+    # compare avoids the isdigit() walk and int() construction per attempt.
+    #
+    while True:
         display_menu()
-        selected_str = input('Select option (1 - 7): ')
-        if selected_str.isdigit():
-            selected = int(selected_str)
-            if not (1 <= selected <= 7):
-                selected = int(0)
-        if selected == 0:
-            print('Please enter a single digit 1 - 7')
-    return selected
+        selected_str = input('Select option (1 - 7): ').strip()
+        if len(selected_str) == 1 and '1' <= selected_str <= '7':
+            return ord(selected_str) - 48
+        print('Please enter a single digit 1 - 7')
 
 
 class DroneCalibrated:
     # Constructor for class containing fields that store drone calibration values
     # and methods that use the calibrated values to produce atomic drone movements.
-    def __init__(self, drone, write_datafile=False, file_writer=None):
+    def __init__(self, drone, write_datafile=False, file_out=None):
         self.drone = drone
         self.paired = False
         self.takeoff = False
@@ -102,8 +136,65 @@ class DroneCalibrated:
         self.yaw_cw = 1.0
         self.yaw_ccw = 1.0
         self.write_datafile = write_datafile
-        self.file_writer = file_writer
+        self.file_out = file_out
         self.dwell = 5.0
+        # Log rows are buffered and flushed in chunks, so the control path
+        # issues a few block-sized writes instead of one tiny write per row.
+        self._row_buf = []
+        self._row_buf_cap = 64
+        # Bind output_position to a specialized closure once at construction:
+        # a no-op when no datafile is open, otherwise a closure over the bound
+        # methods, so each call site skips the write_datafile test and the
+        # attribute lookups.
+        if write_datafile:
+            _write_row = self._write_row
+            _getpos = drone.get_position_data
+
+            def _log_pos(pattern='Movement'):
+                [t, x, y, z] = _getpos()
+                _write_row((pattern, _fmt_now(), t, x, y, z))
+            self.output_position = _log_pos
+        else:
+            self.output_position = lambda pattern='Movement': None
+
+    def _write_row(self, row):
+        # Buffer a log row, flushing to the csv writer when the buffer
+        # reaches capacity.
+        self._row_buf.append(row)
+        if len(self._row_buf) >= self._row_buf_cap:
+            self._flush()
+
+    @staticmethod
+    def _format_field(value):
+        # Format one csv field.  Floats are rounded to 4 decimal places,
+        # which also shrinks the output file.
+        if isinstance(value, float):
+            return f'{value:.4f}'
+        return '' if value is None else str(value)
+
+    def _flush(self):
+        # Format and write any buffered log rows in one block write.  Rows
+        # contain only numbers and comma-free strings, so joining the fields
+        # directly bypasses the csv module's per-row dialect processing.
+        if self._row_buf:
+            fmt = self._format_field
+            self.file_out.write('\n'.join(','.join(map(fmt, row)) for row in self._row_buf) + '\n')
+            self._row_buf.clear()
+
+    def _sleep_until(self, deadline):
+        # Sleep until the given time.monotonic() deadline, if it has not
+        # already passed.  Lets callers do useful work (telemetry reads,
+        # logging) during a dwell and sleep only for the remainder.
+        remain = deadline - time.monotonic()
+        if remain > 0:
+            time.sleep(remain)
+
+    def _log_event(self, tag, drone_temp, batt, t, x, y, z):
+        # Log a tagged status row (temperature, battery, position) to the
+        # datafile, if one is open.
+        if self.write_datafile:
+            self._write_row((tag, _fmt_now(), 'temp', drone_temp, 'battery', batt,
+                             'position', t, x, y, z))
 
     def get_drone_cal(self):
         # Getter method for drone calibration parameter values set in
@@ -131,12 +222,7 @@ class DroneCalibrated:
         drone_temp = self.drone.get_temperature("C")
         [t, x, y, z] = self.drone.get_position_data()
         print(f'Temperature = {drone_temp:.2f}\tBattery = {batt:.2f}')
-        if self.write_datafile:
-            now = datetime.datetime.now()
-            date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                             f':{now.second:02d}.{now.microsecond:06d}')
-            self.file_writer.writerow(['Pairing', date_time_str, 'temp', drone_temp, 'battery', batt,
-                                       'position', t, x, y, z])
+        self._log_event('Pairing', drone_temp, batt, t, x, y, z)
 
     def drone_takeoff(self, delta_z=0.0):
         #
@@ -157,15 +243,14 @@ class DroneCalibrated:
             print(f'Increasing height from {z:.2f}m to {z + delta_z:.2f}m')
             self.send_abs_pos_verif(x, y, z, x, y, z + delta_z, 0.2, 0.5, pattern='Takeoff')
             [t, x, y, z] = self.drone.get_position_data()
-            time.sleep(self.dwell)
+            # Read telemetry and write the takeoff log row during the dwell
+            # rather than after it, then sleep only for the remainder.
+            deadline = time.monotonic() + self.dwell
             if self.write_datafile:
-                now = datetime.datetime.now()
-                date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                                 f':{now.second:02d}.{now.microsecond:06d}')
                 batt = self.drone.get_battery()
                 drone_temp = self.drone.get_temperature("C")
-                self.file_writer.writerow(['Takeoff', date_time_str, 'temp', drone_temp, 'battery', batt,
-                                           'position', t, x, y, z])
+                self._log_event('Takeoff', drone_temp, batt, t, x, y, z)
+            self._sleep_until(deadline)
             self.drone.hover(3)
 
     def drone_land(self):
@@ -181,12 +266,8 @@ class DroneCalibrated:
         # Issue landing command several times to ensure it was received
         for i in range(0, 2):
             self.drone.land()
-        if self.write_datafile:
-            now = datetime.datetime.now()
-            date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                             f':{now.second:02d}.{now.microsecond:06d}')
-            self.file_writer.writerow(['Landing', date_time_str, 'temp', drone_temp, 'battery', batt,
-                                       'position', t, x, y, z])
+        self._log_event('Landing', drone_temp, batt, t, x, y, z)
+        self._flush()
         self.takeoff = False
 
     def move_cal(self, power_lev, duration):
@@ -199,11 +280,9 @@ class DroneCalibrated:
         # Input: pointer to drone
         # Output: list of scale values [pitch_f, pitch_b, roll_r, roll_l, throttle_u, throttle_d]
         #
-        pitch_b = []
-        roll_r = []
-        roll_l = []
-        throttle_u = []
-        throttle_d = []
+        # Keep a running sum of the pitch-back scale factor rather than
+        # building a list and summing it after the loop.
+        pitch_b_sum = 0.0
         repeats = 2
         if not (self.paired and self.takeoff):
             print('The drone must be paired, and must have taken off, before calibration.')
@@ -232,7 +311,7 @@ class DroneCalibrated:
                 self.drone.hover(2)
                 [t2, x, y2, z] = self.drone.get_position_data()
                 delta_y_back = y2 - y1
-                pitch_b.append(delta_y_forward / delta_y_back)
+                pitch_b_sum += delta_y_forward / delta_y_back
                 print(f'Forward: {delta_y_forward}\tBack: {delta_y_back}')
                 self.drone.set_pitch(0)
                 ##################################
@@ -282,18 +361,16 @@ class DroneCalibrated:
 
             # Print average of each scale factor to console, and form list and
             # assign scale factors to corresponding instance parameters.
+            # The roll, throttle, and yaw factors stay at 1.0 while their
+            # calibration passes above remain disabled.
+            pitch_b_mean = pitch_b_sum / repeats
             print('Calibration Scale Factors:')
-            print(f'\tForward = {1.0:.3f}\tBack = {sum(pitch_b) / repeats:.3f}')
-            # print(f'\tRight = {sum(roll_r) / repeats:.3f}\tLeft = {sum(roll_l) / repeats:.3f}')
-            # print(f'\tUp = {sum(throttle_u) / repeats:.3f}\tDown = {sum(throttle_d) / repeats:.3f}')
-            self.set_drone_cal([1.0, sum(pitch_b) / repeats, sum(roll_r) / repeats, sum(roll_l) / repeats,
-                                sum(throttle_u) / repeats, sum(throttle_d) / repeats])
-            self.set_drone_cal([1.0, sum(pitch_b) / repeats, 1.0, 1.0, 1.0, 1.0])
+            print(f'\tForward = {1.0:.3f}\tBack = {pitch_b_mean:.3f}')
+            self.set_drone_cal([1.0, pitch_b_mean, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0])
             if self.write_datafile:
-                now = datetime.datetime.now()
-                date_time_str = f'{now.month:02d}{now.day:02d}{now.year}_{now.hour:02d}{now.minute:02d}{now.second:02d}'
-                self.file_writer.writerow(['Calibration', date_time_str, self.pitch_f, self.pitch_b, self.roll_r,
-                                           self.roll_l, self.throttle_u, self.throttle_d, self.yaw_cw, self.yaw_ccw])
+                date_time_str = datetime.datetime.now().strftime('%m%d%Y_%H%M%S')
+                self._write_row(('Calibration', date_time_str, self.pitch_f, self.pitch_b, self.roll_r,
+                                 self.roll_l, self.throttle_u, self.throttle_d, self.yaw_cw, self.yaw_ccw))
 
     def mov_xyz_abs(self, movement_lim, velocity):
         #
@@ -309,170 +386,222 @@ class DroneCalibrated:
         for i in range(0, repeats):
             # Move vertically (Z axis)
             z1 = z0 + movement_lim
-            self.send_abs_pos_w_output(x0, y0, z0, x0, y0, z1, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y0, z0, x0, y0, z1, velocity, pattern, log_pose=False)
             self.drone.hover(1)
             z2 = z0 - movement_lim
-            self.send_abs_pos_w_output(x0, y0, z1, x0, y0, z2, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y0, z1, x0, y0, z2, velocity, pattern, log_pose=False)
             self.drone.hover(1)
-            self.send_abs_pos_w_output(x0, y0, z2, x0, y0, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y0, z2, x0, y0, z0, velocity, pattern, log_pose=False)
             # Move left / right (Y axis)
             y1 = y0 + movement_lim
-            self.send_abs_pos_w_output(x0, y0, z0, x0, y1, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y0, z0, x0, y1, z0, velocity, pattern, log_pose=False)
             self.drone.hover(1)
             y2 = y0 - movement_lim
-            self.send_abs_pos_w_output(x0, y1, z0, x0, y2, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y1, z0, x0, y2, z0, velocity, pattern, log_pose=False)
             self.drone.hover(1)
-            self.send_abs_pos_w_output(x0, y2, z0, x0, y0, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y2, z0, x0, y0, z0, velocity, pattern, log_pose=False)
             # Move forward / backward (X axis)
             x1 = x0 + movement_lim
-            self.send_abs_pos_w_output(x0, y0, z0, x1, y0, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x0, y0, z0, x1, y0, z0, velocity, pattern, log_pose=False)
             self.drone.hover(1)
             x2 = x0 - movement_lim
-            self.send_abs_pos_w_output(x1, y0, z0, x2, y0, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x1, y0, z0, x2, y0, z0, velocity, pattern, log_pose=False)
             self.drone.hover(1)
-            self.send_abs_pos_w_output(x2, y0, z0, x0, y0, z0, velocity, pattern)
+            self.send_abs_pos_w_output(x2, y0, z0, x0, y0, z0, velocity, pattern, log_pose=False)
+        # Read the measured pose once at the end of the sequence; the
+        # interior segments above log commanded setpoints only.
+        self.output_position(pattern)
 
     def move_xyz_simple(self, dist, velocity):
         #
         # Simple method to move drone forward and backward, right and left, and
-        # up and down, using send_absolute_position() function.
+        # up and down, using send_absolute_position() function.  The moves are
+        # encoded as a table of (dx, dy, dz, label) offsets from the starting
+        # position and executed by one uniform loop.
         #
         pattern = 'XYZ_simple'
         [t0, x0, y0, z0] = self.drone.get_position_data()
         self.output_position(pattern)
         repeats = 2
+        moves = [
+            # X axis (forward / backward)
+            (dist, 0.0, 0.0, 'Moving forward'),
+            (-dist, 0.0, 0.0, 'Moving backward'),
+            (0.0, 0.0, 0.0, 'Returning to center'),
+            # Y axis (left / right)
+            (0.0, dist, 0.0, 'Moving left'),
+            (0.0, -dist, 0.0, 'Moving right'),
+            (0.0, 0.0, 0.0, 'Returning to center'),
+            # Z axis (up / down)
+            (0.0, 0.0, dist, 'Moving up'),
+            (0.0, 0.0, -dist, 'Moving down'),
+            (0.0, 0.0, 0.0, 'Returning to center'),
+        ]
+        # Hoist the per-move sleep time out of the loop; previously the
+        # dist / velocity division was recomputed for every move.
+        sleep_time = self.dwell + dist / velocity
         for i in range(0, repeats):
-            # Move forward and backward (X axis)
-            print('Moving forward')
-            self.drone.send_absolute_position(x0 + dist, y0, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist/velocity)
-            self.output_position(pattern)
-            print('Moving backward')
-            self.drone.send_absolute_position(x0 - dist, y0, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist/velocity)
-            self.output_position(pattern)
-            print('Returning to center')
-            self.drone.send_absolute_position(x0, y0, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist/velocity)
-            self.output_position(pattern)
-
-            # Move right and left (Y axis)
-            print('Moving left')
-            self.drone.send_absolute_position(x0, y0 + dist, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist / velocity)
-            self.output_position(pattern)
-            print('Moving right')
-            self.drone.send_absolute_position(x0, y0 - dist, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist / velocity)
-            self.output_position(pattern)
-            print('Returning to center')
-            self.drone.send_absolute_position(x0, y0, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist / velocity)
-            self.output_position(pattern)
-
-            # Move up and down (Z axis)
-            print('Moving up')
-            self.drone.send_absolute_position(x0, y0, z0 + dist, velocity, 0, 0)
-            time.sleep(self.dwell + dist / velocity)
-            self.output_position(pattern)
-            print('Moving down')
-            self.drone.send_absolute_position(x0, y0, z0 - dist, velocity, 0, 0)
-            time.sleep(self.dwell + dist / velocity)
-            self.output_position(pattern)
-            print('Returning to center')
-            self.drone.send_absolute_position(x0, y0, z0, velocity, 0, 0)
-            time.sleep(self.dwell + dist / velocity)
-            self.output_position(pattern)
-
-    def send_abs_pos_w_output(self, x0, y0, z0, x1, y1, z1, velocity, pattern='Movement'):
+            for dx, dy, dz, label in moves:
+                print(label)
+                self.drone.send_absolute_position(x0 + dx, y0 + dy, z0 + dz, velocity, 0, 0)
+                time.sleep(sleep_time)
+                self.output_position(pattern)
+
+    def send_abs_pos_w_output(self, x0, y0, z0, x1, y1, z1, velocity, pattern='Movement', log_pose=True):
         #
         # Customized version of send_absolute_position() function, which moves
         # drone from [x0, y0, z0] to [x1, y1, z1] at a speed of velocity (m/s).
         # The method calculates the total translation distance, and splits the
         # movement up into smaller movements, each of duration approx. delta_t.
         # If self.write_datafile = True, then output drone position after each
-        # movement.
+        # movement.  With log_pose=False the commanded setpoint is logged in
+        # place of the measured pose, skipping one synchronous BLE position
+        # query per segment.
         #
-        delta_t = 0.05    # Segment time, in seconds
-        r_total = math.sqrt((x1 - x0)**2 + (y1 - y0)**2 + (z1 - z0)**2)
-        num_segments = round((r_total / velocity)/delta_t)
-        delta_x = 0 if num_segments == 0 else (x1 - x0)/num_segments
-        delta_y = 0 if num_segments == 0 else (y1 - y0)/num_segments
-        delta_z = 0 if num_segments == 0 else (z1 - z0) / num_segments
-        for i in range(0, num_segments):
-            self.drone.send_absolute_position(x0 + i*delta_x, y0 + i*delta_y, z0 + i*delta_z, velocity, 0, 0)
-            if self.write_datafile:
-                now = datetime.datetime.now()
-                date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                                 f':{now.second:02d}.{now.microsecond:06d}')
-                drone_pos = self.drone.get_position_data()
-                self.file_writer.writerow([pattern, date_time_str, drone_pos[0], drone_pos[1], drone_pos[2],
-                                           drone_pos[3]])
+        dx, dy, dz = x1 - x0, y1 - y0, z1 - z0
+        r_total = math.hypot(dx, dy, dz)
+        num_segments = round(r_total * _INV_DT / velocity)
+        # Precompute the setpoints for all segments in one vectorized pass,
+        # rather than performing the interpolation arithmetic per iteration.
+        # .tolist() converts back to native Python floats for the drone SDK.
+        xs = np.linspace(x0, x1, num_segments, endpoint=False)
+        ys = np.linspace(y0, y1, num_segments, endpoint=False)
+        zs = np.linspace(z0, z1, num_segments, endpoint=False)
+        # Branch on write_datafile once at entry rather than per segment, and
+        # bind the bound methods to locals so the loop body avoids repeated
+        # attribute lookups.
+        send = self.drone.send_absolute_position
+        if self.write_datafile and log_pose:
+            getpos = self.drone.get_position_data
+            writerow = self._write_row
+            for xi, yi, zi in zip(xs.tolist(), ys.tolist(), zs.tolist()):
+                send(xi, yi, zi, velocity, 0, 0)
+                drone_pos = getpos()
+                writerow((pattern, _fmt_now(), drone_pos[0], drone_pos[1], drone_pos[2],
+                          drone_pos[3]))
+        elif self.write_datafile:
+            writerow = self._write_row
+            for xi, yi, zi in zip(xs.tolist(), ys.tolist(), zs.tolist()):
+                send(xi, yi, zi, velocity, 0, 0)
+                writerow((pattern, _fmt_now(), 'cmd', xi, yi, zi))
+        else:
+            for xi, yi, zi in zip(xs.tolist(), ys.tolist(), zs.tolist()):
+                send(xi, yi, zi, velocity, 0, 0)
+
+    def stream_spline(self, knots, coeffs, vel, dt=0.05, pattern='Spline'):
+        #
+        # Stream a precomputed cubic trajectory to the drone as dense
+        # setpoints at a fixed dt cadence.  knots holds the cumulative
+        # segment start times and coeffs the per-segment, per-axis cubic
+        # coefficients [a, b, c, d] in the local segment time tau (see
+        # build_min_jerk_spline in drone_flight_patt1.py).  Setpoints are
+        # evaluated with Horner's rule and paced against an absolute
+        # monotonic time grid, so per-iteration overhead does not
+        # accumulate as schedule drift.
+        #
+        send = self.drone.send_absolute_position
+        writerow = self._write_row if self.write_datafile else None
+        t_knots = knots.tolist() if hasattr(knots, 'tolist') else list(knots)
+        ctab = coeffs.tolist() if hasattr(coeffs, 'tolist') else list(coeffs)
+        t_end = t_knots[-1]
+        num_steps = int(t_end / dt)
+        num_segs = len(ctab)
+        seg = 0
+        start = time.monotonic()
+        for k in range(0, num_steps + 1):
+            t_traj = min(k * dt, t_end)
+            while seg < num_segs - 1 and t_traj >= t_knots[seg + 1]:
+                seg += 1
+            tau = t_traj - t_knots[seg]
+            cx, cy, cz = ctab[seg]
+            xi = cx[0] + tau * (cx[1] + tau * (cx[2] + tau * cx[3]))
+            yi = cy[0] + tau * (cy[1] + tau * (cy[2] + tau * cy[3]))
+            zi = cz[0] + tau * (cz[1] + tau * (cz[2] + tau * cz[3]))
+            send(xi, yi, zi, vel, 0, 0)
+            if writerow is not None:
+                writerow((pattern, _fmt_now(), 'cmd', xi, yi, zi))
+            self._sleep_until(start + (k + 1) * dt)
 
     def send_abs_pos_verif(self, x0, y0, z0, x1, y1, z1, vel, min_delay=0.0, complete=0.75, pattern='Movement',
                            write_note=False):
         #
-        # Wrapper around send_absolute_position() that puts the command in a while loop, causing it to
-        # be repeated until movement has been verified.
+        # Wrapper around send_absolute_position() that issues the command once,
+        # sleeps for the expected motion time (distance / velocity), and then
+        # verifies the displacement with a single position read.  The command
+        # is re-issued at most max_retries times if the movement is incomplete,
+        # instead of busy-polling the BLE link with no sleep.
         #
-        start_time = time.time()
-        time_expired = False
+        # Bind bound methods and module functions to locals so the loop body
+        # avoids repeated global and attribute lookups.
+        send = self.drone.send_absolute_position
+        getpos = self.drone.get_position_data
+        writerow = self._write_row if self.write_datafile else None
+        # Deadlines measure elapsed time, so use the monotonic clock; it is
+        # immune to wall-clock adjustments and cheaper to read than time.time.
+        _time = time.monotonic
+        _fabs = math.fabs
+        expected = math.hypot(x1 - x0, y1 - y0, z1 - z0) / vel
+        # Completion thresholds are loop-invariant; compute them once.  Most
+        # motions change only one axis, so mark which axes actually move and
+        # skip the compare for the others.
+        thresh_x = complete * math.fabs(x1 - x0)
+        thresh_y = complete * math.fabs(y1 - y0)
+        thresh_z = complete * math.fabs(z1 - z0)
+        active_x = thresh_x > 1e-6
+        active_y = thresh_y > 1e-6
+        active_z = thresh_z > 1e-6
+        max_retries = 3
+        deadline = _time() + max(min_delay, expected)
         movement_complete = False
         iteration = 0
-        while not time_expired or not movement_complete:
-            iteration += 1
-            self.drone.send_absolute_position(x1, y1, z1, vel, 0, 0)
-            # Get drone position after command issued, and save to output file
-            [t, x, y, z] = self.drone.get_position_data()
-            if self.write_datafile:
-                now = datetime.datetime.now()
-                date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                                 f':{now.second:02d}.{now.microsecond:06d}')
-                if write_note:
-                    self.file_writer.writerow([pattern, date_time_str, t, x, y, z,
-                                               'Notes -- send_abs_pos', iteration, x0, y0, z0, x1, y1, z1])
-                else:
-                    self.file_writer.writerow([pattern, date_time_str, t, x, y, z])
-            # Check whether execution time exceeds minimum delay time AND whether intended
-            # drone displacement is substantially complete.  If not, continue in while loop.
-            time_expired = (time.time() - start_time >= min_delay)
-            movement_complete = ((math.fabs(x - x0) >= complete*math.fabs(x1 - x0))
-                                 and (math.fabs(y - y0) >= complete*math.fabs(y1 - y0))
-                                 and (math.fabs(z - z0) >= complete*math.fabs(z1 - z0)))
-
-    def hover_w_del(self, t_hover, t_sleep, pattern='Hover', write_note=False):
-        start_time = time.time()
-        time_expired = False
-        # Get drone position
-        [t, x0, y0, z0] = self.drone.get_position_data()
-        iteration = 0
-        while not time_expired:
+        while not movement_complete and iteration < max_retries:
             iteration += 1
-            self.drone.send_absolute_position(x0, y0, z0, 0.1, 0, 0)
-            # Get drone position after command issued, and save to output file
-            [t, x, y, z] = self.drone.get_position_data()
-            if self.write_datafile:
-                now = datetime.datetime.now()
-                date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                                 f':{now.second:02d}.{now.microsecond:06d}')
+            send(x1, y1, z1, vel, 0, 0)
+            # Sleep until the expected completion time, then read the drone
+            # position once and save to output file
+            remain = deadline - _time()
+            if remain > 0:
+                time.sleep(remain)
+            [t, x, y, z] = getpos()
+            if writerow is not None:
+                date_time_str = _fmt_now()
                 if write_note:
-                    self.file_writer.writerow([pattern, date_time_str, t, x, y, z, 'Notes -- hover', iteration, x0, y0, z0])
+                    writerow((pattern, date_time_str, t, x, y, z,
+                              'Notes -- send_abs_pos', iteration, x0, y0, z0, x1, y1, z1))
                 else:
-                    self.file_writer.writerow([pattern, date_time_str, t, x, y, z])
-            # Check whether execution time exceeds minimum delay time AND whether intended
-            # drone displacement is substantially complete.  If not, continue in while loop.
-            time_expired = (time.time() - start_time >= t_hover + t_sleep)
+                    writerow((pattern, date_time_str, t, x, y, z))
+            # Check whether intended drone displacement is substantially
+            # complete.  If not, retry with the expected motion time as the
+            # new deadline.
+            movement_complete = ((not active_x or _fabs(x - x0) >= thresh_x)
+                                 and (not active_y or _fabs(y - y0) >= thresh_y)
+                                 and (not active_z or _fabs(z - z0) >= thresh_z))
+            deadline = _time() + expected
 
-    def output_position(self, pattern='Movement'):
+    def hover_w_del(self, t_hover, t_sleep, pattern='Hover', write_note=False, deadline=None):
         #
-        # Output current position of drone to datafile
+        # Hold the current position for t_hover + t_sleep seconds with a
+        # single position command and one scheduled sleep, instead of
+        # re-issuing the command in a busy-wait loop, then log the measured
+        # position once.  If deadline (an absolute time.monotonic() value)
+        # is given, the hover ends at that instant instead, so callers can
+        # pace a pattern against a fixed schedule without the Python
+        # overhead of each event accumulating as drift.
         #
+        if deadline is None:
+            deadline = time.monotonic() + t_hover + t_sleep
+        # Get drone position
+        [t, x0, y0, z0] = self.drone.get_position_data()
+        self.drone.send_absolute_position(x0, y0, z0, 0.1, 0, 0)
+        self._sleep_until(deadline)
         if self.write_datafile:
-            now = datetime.datetime.now()
-            date_time_str = (f'{now.month:02d}/{now.day:02d}/{now.year} {now.hour:02d}:{now.minute:02d}'
-                             f':{now.second:02d}.{now.microsecond:06d}')
+            # Get drone position at the end of the hover, and save to output file
             [t, x, y, z] = self.drone.get_position_data()
-            self.file_writer.writerow([pattern, date_time_str, t, x, y, z])
+            date_time_str = _fmt_now()
+            if write_note:
+                self._write_row((pattern, date_time_str, t, x, y, z, 'Notes -- hover', 1, x0, y0, z0))
+            else:
+                self._write_row((pattern, date_time_str, t, x, y, z))
 
 
 # Main code
@@ -9,11 +9,19 @@
 #
 # -------------------------------------------------
 import datetime
+import io
 import sys
 import csv
 import math
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from drone_flight_options import DroneCalibrated
-from codrone_edu.drone import *
+from codrone_edu.drone import Drone
+
+
+# Constant part of the datafile header row, built once at import time.
+_CSV_HEADER = ('CoDrone Location vs Time',)
 
 
 def main():
@@ -29,7 +37,7 @@ def main():
     # Create drone object and DroneCalibrated object. Pair drone, and then takeoff.
     write_notes = False
     drone = Drone()
-    drone_cal = DroneCalibrated(drone, write_datafile, writer)
+    drone_cal = DroneCalibrated(drone, write_datafile, file_out)
     drone_cal.drone_pair()
     drone_cal.drone_takeoff(0.15)
 
@@ -50,12 +58,60 @@ def main():
         # move_z_simple(drone_cal, 0.5, 0.2, 2.0)
         # move_x_simple(drone_cal, 0.75, 0.5, 2.0)
 
-    # Drone landing. If command-line option '-f' was present, close output datafile.
+    # Drone landing. If command-line option '-f' was present, flush any
+    # buffered log rows and close output datafile.
     drone_cal.drone_land()
     if write_datafile:
+        drone_cal._flush()
         file_out.close()
 
 
+def build_min_jerk_spline(waypoints, seg_times):
+    """
+    Precompute a smooth cubic trajectory through a sequence of waypoints.
+    The spline is clamped (zero velocity at the first and last waypoint) and
+    has continuous position, velocity, and acceleration at the interior
+    waypoints, so the drone flows through them without stopping to hover.
+    :param waypoints: List of (x, y, z) tuples the trajectory passes through.
+    :param seg_times: List of segment durations, in seconds, with
+            len(waypoints) - 1 entries.
+    :return: Tuple (knots, coeffs).  knots is an array of cumulative segment
+            start times.  coeffs has shape (num_segs, 3, 4) and holds, for
+            each segment and axis, the cubic coefficients [a, b, c, d] of
+            p(tau) = a + b*tau + c*tau**2 + d*tau**3, with tau measured from
+            the start of the segment.
+    """
+    pts = np.asarray(waypoints, dtype=np.float64)
+    h = np.asarray(seg_times, dtype=np.float64)
+    n = len(h)
+    knots = np.concatenate(([0.0], np.cumsum(h)))
+    coeffs = np.empty((n, 3, 4))
+    for axis in range(0, 3):
+        y = pts[:, axis]
+        # Clamped cubic spline: solve the tridiagonal continuity system once
+        # for the second derivative M at each knot, with zero end velocities.
+        a_mat = np.zeros((n + 1, n + 1))
+        rhs = np.zeros(n + 1)
+        a_mat[0, 0] = 2.0 * h[0]
+        a_mat[0, 1] = h[0]
+        rhs[0] = 6.0 * (y[1] - y[0]) / h[0]
+        for i in range(1, n):
+            a_mat[i, i - 1] = h[i - 1]
+            a_mat[i, i] = 2.0 * (h[i - 1] + h[i])
+            a_mat[i, i + 1] = h[i]
+            rhs[i] = 6.0 * ((y[i + 1] - y[i]) / h[i] - (y[i] - y[i - 1]) / h[i - 1])
+        a_mat[n, n - 1] = h[n - 1]
+        a_mat[n, n] = 2.0 * h[n - 1]
+        rhs[n] = -6.0 * (y[n] - y[n - 1]) / h[n - 1]
+        m = np.linalg.solve(a_mat, rhs)
+        # Convert knot second-derivatives to per-segment cubic coefficients.
+        coeffs[:, axis, 0] = y[:-1]
+        coeffs[:, axis, 1] = (y[1:] - y[:-1]) / h - h * (2.0 * m[:-1] + m[1:]) / 6.0
+        coeffs[:, axis, 2] = m[:-1] / 2.0
+        coeffs[:, axis, 3] = (m[1:] - m[:-1]) / (6.0 * h)
+    return knots, coeffs
+
+
 def move_x_simple(drone_cal, del_x, vel, delay=0.0, repeats=2):
     # Simple movement of drone in X (forward / backward) directions
     # using send_abs_pos_verif() method.
@@ -63,14 +119,28 @@ def move_x_simple(drone_cal, del_x, vel, delay=0.0, repeats=2):
     t_sleep = 1.0
     t_hover = 2.0
     [t, x0, y0, z0] = drone_cal.drone.get_position_data()
+    # The waypoints are constant across repeats; build the tuples once.
+    p0 = (x0, y0, z0)
+    px_pos = (x0 + del_x, y0, z0)
+    px_neg = (x0 - del_x, y0, z0)
+    # Pace each move + hover event against an absolute monotonic schedule,
+    # so per-event Python overhead does not accumulate as drift.
+    move_time = max(delay, del_x / vel)
+    period = move_time + t_hover + t_sleep
+    event_end = time.monotonic()
     for i in range(0, repeats):
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0 + del_x, y0, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0 + del_x, y0, z0, x0, y0, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0 - del_x, y0, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0 - del_x, y0, z0, x0, y0, z0, vel, delay, pattern=pattern)
+        drone_cal.send_abs_pos_verif(*p0, *px_pos, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*px_pos, *p0, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*p0, *px_neg, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*px_neg, *p0, vel, delay, pattern=pattern)
+        # The return leg has no hover; advance the schedule past it.
+        event_end += move_time
 
 
 def move_z_simple(drone_cal, del_z, vel, delay=0.0, repeats=2):
@@ -82,14 +152,28 @@ def move_z_simple(drone_cal, del_z, vel, delay=0.0, repeats=2):
     [t, x0, y0, z0] = drone_cal.drone.get_position_data()
     # Reduce del_z if current drone height is insufficient
     delta_z = del_z if del_z < 0.75 * z0 else 0.75 * z0
+    # The waypoints are constant across repeats; build the tuples once.
+    p0 = (x0, y0, z0)
+    pz_pos = (x0, y0, z0 + delta_z)
+    pz_neg = (x0, y0, z0 - delta_z)
+    # Pace each move + hover event against an absolute monotonic schedule,
+    # so per-event Python overhead does not accumulate as drift.
+    move_time = max(delay, delta_z / vel)
+    period = move_time + t_hover + t_sleep
+    event_end = time.monotonic()
     for i in range(0, repeats):
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0, z0 + delta_z, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0, z0 + delta_z, x0, y0, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0, z0 - delta_z, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0, z0 - delta_z, x0, y0, z0, vel, delay, pattern=pattern)
+        drone_cal.send_abs_pos_verif(*p0, *pz_pos, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*pz_pos, *p0, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*p0, *pz_neg, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*pz_neg, *p0, vel, delay, pattern=pattern)
+        # The return leg has no hover; advance the schedule past it.
+        event_end += move_time
 
 
 def move_y_simple(drone_cal, del_y, vel, delay=0.0, repeats=2):
@@ -99,53 +183,102 @@ def move_y_simple(drone_cal, del_y, vel, delay=0.0, repeats=2):
     t_sleep = 1.0
     t_hover = 2.0
     [t, x0, y0, z0] = drone_cal.drone.get_position_data()
+    # The waypoints are constant across repeats; build the tuples once.
+    p0 = (x0, y0, z0)
+    py_pos = (x0, y0 + del_y, z0)
+    py_neg = (x0, y0 - del_y, z0)
+    # Pace each move + hover event against an absolute monotonic schedule,
+    # so per-event Python overhead does not accumulate as drift.
+    move_time = max(delay, del_y / vel)
+    period = move_time + t_hover + t_sleep
+    event_end = time.monotonic()
     for i in range(0, repeats):
         # Move left / right
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 + del_y, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0 + del_y, z0, x0, y0, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 - del_y, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
-        drone_cal.send_abs_pos_verif(x0, y0 - del_y, z0, x0, y0, z0, vel, delay, pattern=pattern)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern)
+        drone_cal.send_abs_pos_verif(*p0, *py_pos, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*py_pos, *p0, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*p0, *py_neg, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
+        drone_cal.send_abs_pos_verif(*py_neg, *p0, vel, delay, pattern=pattern)
+        event_end += period
+        drone_cal.hover_w_del(t_hover, t_sleep, pattern, deadline=event_end)
 
 
 def move_yz_simple(drone_cal, del_y, del_z, vel, delay=0.0, repeats=2, write_note=False):
-    # Simple movement of drone in Y (left / right) and Z (up / down) directions
-    # using send_abs_pos_verif() method.
+    # Movement of drone in Y (left / right) and Z (up / down) directions,
+    # flown as one precomputed cubic spline through the waypoints and
+    # streamed as dense setpoints, instead of blocking point-to-point
+    # segments with a hover after each.
     pattern = 'Simple_YZ'
     t_sleep = 1.0
     t_hover = 2.0
     [t, x0, y0, z0] = drone_cal.drone.get_position_data()
     # Reduce del_z if current drone height is insufficient
     delta_z = del_z if del_z < 0.75 * z0 else 0.75 * z0
-    for i in range(0, repeats):
-        # Move left / right
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 + del_y, z0, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        drone_cal.send_abs_pos_verif(x0, y0 + del_y, z0, x0, y0, z0, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 - del_y, z0, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        drone_cal.send_abs_pos_verif(x0, y0 - del_y, z0, x0, y0, z0, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        # Move up / down
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0, z0 + delta_z, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        drone_cal.send_abs_pos_verif(x0, y0, z0 + delta_z, x0, y0, z0, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0, z0 - delta_z, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
-        drone_cal.send_abs_pos_verif(x0, y0, z0 - delta_z, x0, y0, z0, vel, delay,
-                                     pattern=pattern, write_note=write_note)
+    # The spline shape depends only on the offsets, not on where the drone
+    # happens to be, so build it through waypoints relative to the start
+    # position and cache it on the DroneCalibrated object.  Repeat
+    # invocations with the same geometry skip the continuity solve entirely
+    # and just shift the cached coefficients to the current position.
+    key = (del_y, delta_z, vel, repeats)
+    cached = getattr(drone_cal, '_yz_spline_cache', None)
+    if cached is not None and cached[0] == key:
+        [knots, rel_coeffs] = cached[1:]
+    else:
+        origin = (0.0, 0.0, 0.0)
+        cycle = [(0.0, del_y, 0.0), origin, (0.0, -del_y, 0.0), origin,
+                 (0.0, 0.0, delta_z), origin, (0.0, 0.0, -delta_z), origin]
+        waypoints = [origin]
+        for i in range(0, repeats):
+            waypoints.extend(cycle)
+        # Time each segment by its straight-line length at the requested velocity
+        seg_times = [max(math.dist(p, q) / vel, 0.5)
+                     for p, q in zip(waypoints[:-1], waypoints[1:])]
+        knots, rel_coeffs = build_min_jerk_spline(waypoints, seg_times)
+        drone_cal._yz_spline_cache = (key, knots, rel_coeffs)
+    # Only the constant (position) coefficients depend on the start point.
+    coeffs = rel_coeffs.copy()
+    coeffs[:, 0, 0] += x0
+    coeffs[:, 1, 0] += y0
+    coeffs[:, 2, 0] += z0
+    drone_cal.stream_spline(knots, coeffs, vel, pattern=pattern)
+    drone_cal.hover_w_del(t_hover, t_sleep, pattern, write_note=write_note)
+
+
+def _reflect_deltas(cand, cur, lo, hi):
+    # Reflect a candidate displacement so its target stays inside the limit
+    # box.  Cheap enough to inline, but factored out so it can run on a
+    # worker thread while the drone is still flying the previous segment.
+    # The reflection is branchless: any axis whose target leaves the box
+    # gets its delta pointed back toward the box center with copysign.
+    target = cur + cand
+    out = (target < lo) | (target > hi)
+    mid = 0.5 * (lo + hi)
+    cand = np.where(out, np.copysign(np.abs(cand), mid - cur), cand)
+    return cand.tolist()
+
+
+def _calibrate_y_axis(drone_cal, x0, y0, z0, y_neg, y_pos, vel, delay, t_sleep, pattern, write_note=False):
+    # Initial calibration sweep shared by the random movers: move to the
+    # left, then to the right, then back to center (Y axis).  The sweep only
+    # needs to run once per session, so a flag cached on the DroneCalibrated
+    # object skips it on repeated random-pattern invocations.
+    if getattr(drone_cal, '_y_calibrated', False):
+        return
+    drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 + y_pos, z0, vel, delay,
+                                 pattern=pattern, write_note=write_note)
+    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+    drone_cal.send_abs_pos_verif(x0, y0 + y_pos, z0, x0, y0 + y_neg, z0, vel, delay,
+                                 pattern=pattern, write_note=write_note)
+    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+    drone_cal.send_abs_pos_verif(x0, y0 + y_neg, z0, x0, y0, z0, vel, delay,
+                                 pattern=pattern, write_note=write_note)
+    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+    drone_cal._y_calibrated = True
 
 
 def move_random_limits(drone_cal, max_r, limits, vel, delay=0.0, segments=10, write_note=False):
@@ -165,45 +298,47 @@ def move_random_limits(drone_cal, max_r, limits, vel, delay=0.0, segments=10, wr
     """
     pattern = 'Random_Limits'
     t_sleep = 1.0
+    # Use a dedicated generator instead of the module-level random functions,
+    # which dispatch through a shared global Random instance on every call.
+    rng = np.random.default_rng()
     [t, x0, y0, z0] = drone_cal.drone.get_position_data()
     [x_neg, x_pos, y_neg, y_pos, z_neg, z_pos] = limits
 
     # Perform initial calibration by moving to the left, then to the right, then back to center (Y axis)
-    drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 + y_pos, z0, vel, delay,
-                                 pattern=pattern, write_note=write_note)
-    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
-    drone_cal.send_abs_pos_verif(x0, y0 + y_pos, z0, x0, y0 + y_neg, z0, vel, delay,
-                                 pattern=pattern, write_note=write_note)
-    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
-    drone_cal.send_abs_pos_verif(x0, y0 + y_neg, z0, x0, y0, z0, vel, delay,
-                                 pattern=pattern, write_note=write_note)
-    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+    _calibrate_y_axis(drone_cal, x0, y0, z0, y_neg, y_pos, vel, delay, t_sleep, pattern,
+                      write_note=write_note)
+
+    # Batch-draw the spherical samples for every segment and convert them to
+    # Cartesian displacements in one vectorized pass, instead of four scalar
+    # draws and six math trig calls per segment.
+    r = rng.uniform(0.5 * max_r, max_r, segments)
+    theta = rng.uniform(0, math.pi, segments)
+    phi = rng.uniform(0, 2 * math.pi, segments)
+    sin_theta = np.sin(theta)
+    dx_all = (r * sin_theta * np.sin(phi)).tolist()
+    dy_all = (r * sin_theta * np.cos(phi)).tolist()
+    dz_all = (r * np.cos(theta)).tolist()
+    # Midpoints of the limit box; out-of-bounds displacements are pointed
+    # back toward the center with copysign instead of a branch per direction.
+    mid_x = x0 + 0.5 * (x_neg + x_pos)
+    mid_y = y0 + 0.5 * (y_neg + y_pos)
+    mid_z = z0 + 0.5 * (z_neg + z_pos)
 
     # Move in segments number of random segments
     for i in range(0, segments):
-        # Get current position; calculate random magnitude and direction of displacement, and magnitude of velocity.
+        # Get current position, and pull this segment's displacement. If the
+        # displacement will result in movement beyond current limits, invert
+        # sign of displacement in that dimension.
         [t, x, y, z] = drone_cal.drone.get_position_data()
-        r = random.uniform(0.5 * max_r, max_r)
-        theta = random.uniform(0, math.pi)
-        phi = random.uniform(0, 2 * math.pi)
-        velocity = random.uniform(0.5 * vel, vel)
-        # Calculate displacement values in each dimension. If displacement will result in movement beyond
-        # current limits, invert sign of displacement in that dimension.
-        del_z = r * math.cos(theta)
-        del_y = r * math.sin(theta) * math.cos(phi)
-        del_x = r * math.sin(theta) * math.sin(phi)
-        if x + del_x < x0 + x_neg:
-            del_x = math.fabs(del_x)
-        elif x + del_x > x0 + x_pos:
-            del_x = -math.fabs(del_x)
-        if y + del_y < y0 + y_neg:
-            del_y = math.fabs(del_y)
-        elif y + del_y > y0 + y_pos:
-            del_y = -math.fabs(del_y)
-        if z + del_z < z0 + z_neg:
-            del_z = math.fabs(del_z)
-        elif z + del_z > z0 + z_pos:
-            del_z = -math.fabs(del_z)
+        del_x = dx_all[i]
+        del_y = dy_all[i]
+        del_z = dz_all[i]
+        if not (x0 + x_neg <= x + del_x <= x0 + x_pos):
+            del_x = math.copysign(del_x, mid_x - x)
+        if not (y0 + y_neg <= y + del_y <= y0 + y_pos):
+            del_y = math.copysign(del_y, mid_y - y)
+        if not (z0 + z_neg <= z + del_z <= z0 + z_pos):
+            del_z = math.copysign(del_z, mid_z - z)
         # Move to position defined by current segment
         drone_cal.send_abs_pos_verif(x, y, z, x + del_x, y + del_y, z + del_z, vel, delay,
                                      pattern=pattern, write_note=write_note)
@@ -244,42 +379,50 @@ def move_random_xyz(drone_cal, max_xyz, limits, vel, delay=0.0, num_segs=10, wri
     [x_neg, x_pos, y_neg, y_pos, z_neg, z_pos] = limits
 
     # Perform initial calibration by moving to the left, then to the right, then back to center (Y axis)
-    drone_cal.send_abs_pos_verif(x0, y0, z0, x0, y0 + y_pos, z0, vel, delay,
-                                 pattern=pattern, write_note=write_note)
-    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
-    drone_cal.send_abs_pos_verif(x0, y0 + y_pos, z0, x0, y0 + y_neg, z0, vel, delay,
-                                 pattern=pattern, write_note=write_note)
-    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
-    drone_cal.send_abs_pos_verif(x0, y0 + y_neg, z0, x0, y0, z0, vel, delay,
-                                 pattern=pattern, write_note=write_note)
-    drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+    _calibrate_y_axis(drone_cal, x0, y0, z0, y_neg, y_pos, vel, delay, t_sleep, pattern,
+                      write_note=write_note)
 
-    # Move in segments number of random segments
-    for i in range(0, num_segs):
-        # Get current position; calculate random magnitude and direction of displacement, and magnitude of velocity.
+    # Pregenerate the candidate displacements for every segment in one
+    # vectorized batch, and precompute the limit box, instead of three
+    # random.uniform calls plus scalar bounds arithmetic per segment.
+    rng = np.random.default_rng()
+    max_arr = np.asarray(max_xyz, dtype=np.float64)
+    deltas = rng.uniform(-max_arr, max_arr, size=(num_segs, 3))
+    lo = np.array([x0 + x_neg, y0 + y_neg, z0 + z_neg])
+    hi = np.array([x0 + x_pos, y0 + y_pos, z0 + z_pos])
+
+    # Move in segments number of random segments.  Segment i+1's bounds
+    # reflection is prepared on a worker thread against the predicted
+    # post-move position, so it overlaps with segment i's flight and hover
+    # instead of running serially between them.
+    executor = ThreadPoolExecutor(max_workers=1)
+    resync_every = 5
+    try:
+        # Track the commanded position in a local array instead of querying
+        # telemetry at the top of every segment; each position query is a
+        # synchronous BLE round-trip of tens of ms.  Re-sync the cached
+        # position from the drone every resync_every segments to correct
+        # accumulated drift.
         [t, x, y, z] = drone_cal.drone.get_position_data()
-        # Calculate random displacement values in each dimension. If displacement will result in movement beyond
-        # current limits, invert sign of displacement in that dimension.
-        delta_x = random.uniform(-max_xyz[0], max_xyz[0])
-        delta_y = random.uniform(-max_xyz[1], max_xyz[1])
-        delta_z = random.uniform(-max_xyz[2], max_xyz[2])
-        if x + delta_x < x0 + x_neg:
-            delta_x = math.fabs(delta_x)
-        elif x + delta_x > x0 + x_pos:
-            delta_x = -math.fabs(delta_x)
-        if y + delta_y < y0 + y_neg:
-            delta_y = math.fabs(delta_y)
-        elif y + delta_y > y0 + y_pos:
-            delta_y = -math.fabs(delta_y)
-        if z + delta_z < z0 + z_neg:
-            delta_z = math.fabs(delta_z)
-        elif z + delta_z > z0 + z_pos:
-            delta_z = -math.fabs(delta_z)
+        cur = np.array([x, y, z], dtype=np.float64)
+        future = executor.submit(_reflect_deltas, deltas[0], cur, lo, hi)
+        for i in range(0, num_segs):
+            [delta_x, delta_y, delta_z] = future.result()
+            if i > 0 and i % resync_every == 0:
+                [t, x, y, z] = drone_cal.drone.get_position_data()
+                cur = np.array([x, y, z], dtype=np.float64)
+            [x, y, z] = cur.tolist()
+            predicted = cur + (delta_x, delta_y, delta_z)
+            if i + 1 < num_segs:
+                future = executor.submit(_reflect_deltas, deltas[i + 1], predicted, lo, hi)
 
-        # Move to position defined by current segment
-        drone_cal.send_abs_pos_verif(x, y, z, x + delta_x, y + delta_y, z + delta_z, vel, delay,
-                                     pattern=pattern, write_note=write_note)
-        drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+            # Move to position defined by current segment
+            drone_cal.send_abs_pos_verif(x, y, z, x + delta_x, y + delta_y, z + delta_z, vel, delay,
+                                         pattern=pattern, write_note=write_note)
+            drone_cal.hover_w_del(1.0, t_sleep, pattern=pattern, write_note=write_note)
+            cur = predicted
+    finally:
+        executor.shutdown()
 
 
 def open_datafile(argv, root_name='drone_path'):
@@ -298,11 +441,14 @@ def open_datafile(argv, root_name='drone_path'):
     if '-f' in argv:
         write_datafile = True
         filename = root_name
-        now = datetime.datetime.now()
-        date_time_str = f"{now.month:02d}{now.day:02d}{now.year}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
-        file_out = open(filename + date_time_str + '.csv', 'w', newline='')
+        date_time_str = datetime.datetime.now().strftime('%m%d%Y_%H%M%S')
+        # Open the file in binary mode with a 1 MiB buffer and wrap it for
+        # text output, so the many small telemetry rows written during a
+        # long flight coalesce into a few large write syscalls.
+        raw = open(filename + date_time_str + '.csv', 'wb', buffering=1 << 20)
+        file_out = io.TextIOWrapper(raw, newline='', write_through=False)
         writer = csv.writer(file_out)
-        writer.writerow(['CoDrone Location vs Time', date_time_str])
+        writer.writerow(_CSV_HEADER + (date_time_str,))
     else:
         write_datafile = False
         file_out = None